@@ -1,15 +1,23 @@
 import datetime
-import requests
+import functools
+import hashlib
+import aiohttp
 import google.auth
+from google.auth.exceptions import RefreshError
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
 from discord import Intents
 from discord.ext import tasks, commands
 import var
 import asyncio
-import json
+import orjson
 import os
+import shutil
+import subprocess
 import tarfile
+import threading
 import time
+from concurrent.futures import ThreadPoolExecutor
 import re
 from zoneinfo import ZoneInfo
 
@@ -17,44 +25,158 @@ from zoneinfo import ZoneInfo
 SYNCED_EVENTS_FILE = 'synced_events.json'
 EVENT_LOG_FILE = 'event.log'
 LOG_SIZE_LIMIT = 200 * 1024 * 1024  # 200 MB
+LOG_SIZE_CHECK_INTERVAL = 256  # Check the log size every N writes
+DISCORD_SYNC_CONCURRENCY = 5  # Maximum number of events synced to Discord at once
+
+# Keep the event log open for the lifetime of the process (line-buffered)
+_log_file = open(EVENT_LOG_FILE, 'a', encoding='utf-8', buffering=1)
+_log_writes = 0
+# Reentrant because check_log_size logs the rotation while the lock is held
+_log_lock = threading.RLock()
+# Single worker so log rotation never blocks the bot while compressing
+_log_compressor = ThreadPoolExecutor(max_workers=1)
+
+# Google Calendar API service, built on first use
+_calendar_service = None
+
+# Regular expression to match HTML anchor tags
+# Matches: <a href="URL">TEXT</a>
+_LINK_RE = re.compile(r'<a\s+href="([^"]+)"[^>]*>([^<]+)</a>', re.IGNORECASE)
 
 def load_synced_events():
     """
-    Load the list of events that have been synchronized from the local JSON file.
+    Load the events that have been synchronized from the local JSON file,
+    keyed by Google event ID.
     """
     if os.path.exists(SYNCED_EVENTS_FILE):
-        with open(SYNCED_EVENTS_FILE, 'r', encoding='utf-8') as f:
-            return json.load(f)
-    return {"events": []}
+        with open(SYNCED_EVENTS_FILE, 'rb') as f:
+            synced_events = orjson.loads(f.read())
+        # Older versions stored a list of events under "events", convert it to a dict
+        if isinstance(synced_events.get("events"), list):
+            synced_events = {
+                e["google_event_id"]: {k: v for k, v in e.items() if k != "google_event_id"}
+                for e in synced_events["events"]
+            }
+        # Older versions stored the full signature, convert it to a hash
+        for synced_event in synced_events.values():
+            if "signature" in synced_event:
+                synced_event["sig_hash"] = hash_event_signature(synced_event.pop("signature"))
+        return synced_events
+    return {}
 
 def save_synced_events(synced_events):
     """
-    Save the list of synchronized events to the local JSON file.
+    Save the synchronized events to the local JSON file.
+    Writes to a temporary file first so a crash never leaves a truncated file behind.
     """
-    with open(SYNCED_EVENTS_FILE, 'w', encoding='utf-8') as f:
-        json.dump(synced_events, f, indent=4, ensure_ascii=False)
+    tmp_file = SYNCED_EVENTS_FILE + '.tmp'
+    with open(tmp_file, 'wb') as f:
+        f.write(orjson.dumps(synced_events, option=orjson.OPT_INDENT_2))
+    os.replace(tmp_file, SYNCED_EVENTS_FILE)
 
 def log_event(message):
     """
     Log messages with a timestamp to the event log file.
     """
+    global _log_writes
     timestamp = datetime.datetime.now().strftime('%Y-%m-%d %H:%M:%S')
     log_message = f"{timestamp} {message}\n"
-    with open(EVENT_LOG_FILE, 'a', encoding='utf-8') as log_file:
-        log_file.write(log_message)
-    check_log_size()
+    # The compressor thread logs too, keep writes and rotation from interleaving
+    with _log_lock:
+        _log_file.write(log_message)
+        _log_writes += 1
+        if _log_writes % LOG_SIZE_CHECK_INTERVAL == 0:
+            check_log_size()
+
+def compress_log_file(rotated_dir, tar_filename):
+    """
+    Compress a rotated log file into a tarball and remove the uncompressed copy.
+    Uses the system tar and gzip when available so the log is streamed through
+    separate processes instead of being read and compressed in Python.
+    """
+    # Exclusive create, so an existing archive is never overwritten or removed here
+    tar_file = open(tar_filename, 'xb')
+    try:
+        with tar_file:
+            if shutil.which('tar') and shutil.which('gzip'):
+                tar_process = subprocess.Popen(['tar', '-cf', '-', '-C', rotated_dir, EVENT_LOG_FILE], stdout=subprocess.PIPE)
+                try:
+                    # Fastest gzip level, higher levels cost far more CPU for little size gain on logs
+                    subprocess.run(['gzip', '-1'], stdin=tar_process.stdout, stdout=tar_file, check=True)
+                finally:
+                    # Always close tar's pipe and reap it, even if gzip failed
+                    tar_process.stdout.close()
+                    tar_process.wait()
+                if tar_process.returncode != 0:
+                    raise subprocess.CalledProcessError(tar_process.returncode, 'tar')
+            else:
+                with tarfile.open(fileobj=tar_file, mode="w:gz", compresslevel=1) as tar:
+                    tar.add(os.path.join(rotated_dir, EVENT_LOG_FILE), arcname=EVENT_LOG_FILE)
+    except Exception:
+        # Don't leave a truncated archive behind, the uncompressed log stays in rotated_dir
+        os.remove(tar_filename)
+        raise
+    shutil.rmtree(rotated_dir)
+
+def report_log_compression(rotated_dir, future):
+    """
+    Log any error raised while compressing a rotated log in the background.
+    The uncompressed log is not retried, so point the operator at it.
+    """
+    error = future.exception()
+    if error is not None:
+        log_event(f"Error compressing rotated log file, uncompressed log left in {rotated_dir}: {error}")
 
 def check_log_size():
     """
     Check the size of the event log file and compress it if it exceeds the limit.
+    The log is rotated immediately and compressed in the background.
+    Must be called with _log_lock held.
     """
-    if os.path.exists(EVENT_LOG_FILE) and os.path.getsize(EVENT_LOG_FILE) > LOG_SIZE_LIMIT:
+    global _log_file
+    if os.fstat(_log_file.fileno()).st_size > LOG_SIZE_LIMIT:
         timestamp = datetime.datetime.now().strftime('%Y%m%d%H%M%S')
         tar_filename = f"{timestamp}.tar.gz"
-        with tarfile.open(tar_filename, "w:gz") as tar:
-            tar.add(EVENT_LOG_FILE)
-        os.remove(EVENT_LOG_FILE)
-        log_event(f"Log file compressed to {tar_filename} and reset.")
+        # Move the log into its own directory so it keeps its name inside the archive
+        rotated_dir = f"{EVENT_LOG_FILE}.{timestamp}"
+        # Timestamps have one second resolution, add a suffix if this one was already used
+        suffix = 1
+        while os.path.exists(tar_filename) or os.path.exists(rotated_dir):
+            tar_filename = f"{timestamp}-{suffix}.tar.gz"
+            rotated_dir = f"{EVENT_LOG_FILE}.{timestamp}-{suffix}"
+            suffix += 1
+        os.makedirs(rotated_dir)
+        _log_file.close()
+        os.replace(EVENT_LOG_FILE, os.path.join(rotated_dir, EVENT_LOG_FILE))
+        _log_file = open(EVENT_LOG_FILE, 'a', encoding='utf-8', buffering=1)
+        future = _log_compressor.submit(compress_log_file, rotated_dir, tar_filename)
+        future.add_done_callback(functools.partial(report_log_compression, rotated_dir))
+        log_event(f"Log file rotated, compressing to {tar_filename} and reset.")
+
+def normalize_event_filters(filters):
+    """
+    Lowercase the configured filter values once so they don't have to be lowercased for every event.
+    Keyword lists become a single regular expression that finds any keyword in one pass,
+    prefixes and suffixes become tuples for str.startswith/endswith, and emails become sets.
+    Returns None if no filters are configured.
+    """
+    if not filters:
+        return None
+    normalized = {}
+    for filter_name, values in filters.items():
+        lowered = [value.lower() for value in values]
+        if filter_name.endswith('_contains'):
+            # An empty pattern would match everything, so empty keyword lists are left out
+            if lowered:
+                normalized[filter_name] = re.compile('|'.join(re.escape(keyword) for keyword in lowered))
+        elif filter_name in ('creator_email', 'attendee_email'):
+            normalized[filter_name] = frozenset(lowered)
+        else:
+            normalized[filter_name] = tuple(lowered)
+    return normalized
+
+# Configured event filters, normalized once at startup
+_EVENT_FILTERS = normalize_event_filters(getattr(var, 'EVENT_FILTERS', None))
 
 def should_sync_event(event):
     """
@@ -62,72 +184,74 @@ def should_sync_event(event):
     Returns True if the event matches any of the configured filters.
     """
     # If no filters are configured, sync all events
-    if not hasattr(var, 'EVENT_FILTERS') or not var.EVENT_FILTERS:
+    if _EVENT_FILTERS is None:
         return True
     
-    event_title = event.get('summary', '').lower()
-    event_description = event.get('description', '').lower()
-    event_location = event.get('location', '').lower()
+    # Event fields are only lowercased once a filter actually reads them
+    lowered_fields = {}
+    
+    def lowered(field):
+        if field not in lowered_fields:
+            lowered_fields[field] = event.get(field, '').lower()
+        return lowered_fields[field]
     
-    filters = var.EVENT_FILTERS
+    filters = _EVENT_FILTERS
     
     # Check title filters
     if 'title_contains' in filters:
-        for keyword in filters['title_contains']:
-            if keyword.lower() in event_title:
-                return True
+        if filters['title_contains'].search(lowered('summary')):
+            return True
     
     if 'title_starts_with' in filters:
-        for prefix in filters['title_starts_with']:
-            if event_title.startswith(prefix.lower()):
-                return True
+        if lowered('summary').startswith(filters['title_starts_with']):
+            return True
     
     if 'title_ends_with' in filters:
-        for suffix in filters['title_ends_with']:
-            if event_title.endswith(suffix.lower()):
-                return True
+        if lowered('summary').endswith(filters['title_ends_with']):
+            return True
     
     # Check description filters
     if 'description_contains' in filters:
-        for keyword in filters['description_contains']:
-            if keyword.lower() in event_description:
-                return True
+        if filters['description_contains'].search(lowered('description')):
+            return True
     
     # Check location filters
     if 'location_contains' in filters:
-        for keyword in filters['location_contains']:
-            if keyword.lower() in event_location:
-                return True
+        if filters['location_contains'].search(lowered('location')):
+            return True
     
     # Check if event creator matches filter
     if 'creator_email' in filters:
         creator_email = event.get('creator', {}).get('email', '').lower()
-        for email in filters['creator_email']:
-            if email.lower() == creator_email:
-                return True
+        if creator_email in filters['creator_email']:
+            return True
     
     # Check for specific attendees
     if 'attendee_email' in filters:
         attendees = event.get('attendees', [])
-        attendee_emails = [attendee.get('email', '').lower() for attendee in attendees]
-        for filter_email in filters['attendee_email']:
-            if filter_email.lower() in attendee_emails:
-                return True
+        if any(attendee.get('email', '').lower() in filters['attendee_email'] for attendee in attendees):
+            return True
     
     # Check exclusion filters (events to NOT sync)
     if 'exclude_title_contains' in filters:
-        for keyword in filters['exclude_title_contains']:
-            if keyword.lower() in event_title:
-                return False
+        if filters['exclude_title_contains'].search(lowered('summary')):
+            return False
     
     if 'exclude_description_contains' in filters:
-        for keyword in filters['exclude_description_contains']:
-            if keyword.lower() in event_description:
-                return False
+        if filters['exclude_description_contains'].search(lowered('description')):
+            return False
     
     # If we have filters but none matched, don't sync the event
     return False
 
+def _replace_link(match):
+    """
+    Format a matched HTML anchor tag as "URL (Link Text)".
+    """
+    url = match.group(1)
+    link_text = match.group(2)
+    return f"{url} ({link_text})"
+
 def parse_html_links(text):
     """
     Parse HTML anchor tags in text and convert them to plain text format.
@@ -138,106 +262,62 @@ def parse_html_links(text):
     if not text:
         return text
     
-    # Regular expression to match HTML anchor tags
-    # Matches: <a href="URL">TEXT</a>
-    link_pattern = r'<a\s+href="([^"]+)"[^>]*>([^<]+)</a>'
-    
-    def replace_link(match):
-        url = match.group(1)
-        link_text = match.group(2)
-        return f"{url} ({link_text})"
-    
-    # Replace all HTML links with the new format
-    converted_text = re.sub(link_pattern, replace_link, text, flags=re.IGNORECASE)
+    # Most descriptions contain no anchor tags at all, skip the regex engine for those
+    if '<a' not in text and '<A' not in text:
+        return text
     
-    return converted_text
+    return _convert_html_links(text)
 
-# a function that takes an ISO 8601 datetime string in UTC and returns it converted to the specified timezone with DST handling
-def convert_utc_to_timezone(utc_iso_string, target_timezone_str):
+@functools.lru_cache(maxsize=1024)
+def _convert_html_links(text):
     """
-    Convert an ISO 8601 datetime string to the specified timezone with DST handling.
-    
-    Args:
-        utc_iso_string (str): ISO 8601 datetime string. If ends with 'Z' or has UTC offset, 
-                             converts from UTC. If no timezone info, appends local offset only.
-        target_timezone_str (str): Target timezone name (e.g., "America/New_York", "Europe/London")
-    
-    Returns:
-        str: ISO 8601 datetime string in the target timezone with appropriate DST offset
-        
-    Examples:
-        # With Z suffix - converts from UTC
-        convert_utc_to_timezone("2026-07-15T18:00:00Z", "America/New_York")
-        # Returns: "2026-07-15T14:00:00-04:00" (converted from UTC)
-        
-        # Without Z - keeps time, appends offset  
-        convert_utc_to_timezone("2026-07-15T14:00:00", "America/New_York")
-        # Returns: "2026-07-15T14:00:00-04:00" (same time + EDT offset)
+    Replace all HTML links with the new format.
+    Cached because descriptions rarely change between syncs.
+    """
+    return _LINK_RE.sub(_replace_link, text)
+
+def resolve_timezone(timezone_str):
+    """
+    Look up a timezone by its IANA name, falling back to UTC if it is invalid.
     """
     try:
-        # Determine target timezone first
-        try:
-            target_tz = ZoneInfo(target_timezone_str)
-        except:
-            # Fallback to UTC if target timezone is invalid
-            log_event(f"Warning: Invalid timezone '{target_timezone_str}', using UTC")
-            target_tz = datetime.timezone.utc
-        
-        # Check if the string has timezone information
-        has_timezone_info = (utc_iso_string.endswith('Z') or 
-                           utc_iso_string.endswith('+00:00') or 
-                           '+' in utc_iso_string[-6:] or 
-                           '-' in utc_iso_string[-6:])
-        
-        if has_timezone_info:
-            # Handle strings with timezone info - convert from UTC
-            if utc_iso_string.endswith('Z'):
-                utc_dt = datetime.datetime.fromisoformat(utc_iso_string[:-1] + '+00:00')
-            elif utc_iso_string.endswith('+00:00'):
-                utc_dt = datetime.datetime.fromisoformat(utc_iso_string)
-            else:
-                utc_dt = datetime.datetime.fromisoformat(utc_iso_string)
-            
-            # Ensure the datetime is in UTC
-            if utc_dt.tzinfo is None:
-                utc_dt = utc_dt.replace(tzinfo=datetime.timezone.utc)
-            elif utc_dt.tzinfo != datetime.timezone.utc:
-                utc_dt = utc_dt.astimezone(datetime.timezone.utc)
-            
-            # Convert to target timezone
-            target_dt = utc_dt.astimezone(target_tz)
-            return target_dt.isoformat()
-            
-        else:
-            # No timezone info - keep timestamp, append DST-aware offset
-            naive_dt = datetime.datetime.fromisoformat(utc_iso_string)
-            
-            # Create a datetime in the target timezone to determine the offset
-            localized_dt = naive_dt.replace(tzinfo=target_tz)
-            
-            # Return the same timestamp with the appropriate offset
-            return localized_dt.isoformat()
-        
-    except Exception as e:
-        # Fallback: return original string if conversion fails
-        log_event(f"Warning: DateTime conversion failed for '{utc_iso_string}': {e}")
-        return utc_iso_string
+        return ZoneInfo(timezone_str)
+    except Exception:
+        log_event(f"Warning: Invalid timezone '{timezone_str}', using UTC")
+        return datetime.timezone.utc
 
+# Configured timezone, resolved once at startup
+_TARGET_TZ = resolve_timezone(var.TIMEZONE)
 
+def all_day_bounds(date_str):
+    """
+    Return the start (00:00:00) and end (23:59:59) of an all-day event date
+    as ISO 8601 strings in the configured timezone.
+    """
+    date = datetime.date.fromisoformat(date_str)
+    start = datetime.datetime.combine(date, datetime.time(0, 0, 0), tzinfo=_TARGET_TZ)
+    end = datetime.datetime.combine(date, datetime.time(23, 59, 59), tzinfo=_TARGET_TZ)
+    return start.isoformat(), end.isoformat()
 
-def get_event_signature(event):
+def normalized_times(event):
     """
-    Generate a signature/hash of an event's key properties for change detection.
-    Returns a dictionary with the essential event data that Discord cares about.
+    Return the (start, end) times Discord should use for an event, handling all-day events.
     """
-    # Get start and end times, handling all-day events
     start_time = event['start'].get('dateTime', event['start'].get('date')) # All-day events have 'date' instead of 'dateTime'
     end_time = event['end'].get('dateTime', event['end'].get('date')) # All-day events have 'date' instead of 'dateTime'
     
     if 'date' in event['start']:
-        end_time = convert_utc_to_timezone(start_time + 'T23:59:59', var.TIMEZONE) # All-day event ends at 23:59:59
-        start_time = convert_utc_to_timezone(start_time + 'T00:00:00', var.TIMEZONE) # All-day event starts at 00:00:00
-        
+        start_time, end_time = all_day_bounds(start_time) # All-day event runs from 00:00:00 to 23:59:59
+    
+    return start_time, end_time
+
+def get_event_signature(event, event_times):
+    """
+    Generate a signature/hash of an event's key properties for change detection.
+    Returns a hash of the essential event data that Discord cares about.
+    event_times is the (start, end) pair returned by normalized_times.
+    """
+    start_time, end_time = event_times
     
     # Determine event type based on location
     event_location = event.get('location', '').lower()
@@ -252,34 +332,36 @@ def get_event_signature(event):
         'is_discord_event': is_discord_event
     }
     
-    return signature
+    return hash_event_signature(signature)
 
-def events_are_different(current_event, stored_signature):
+def hash_event_signature(signature):
     """
-    Compare current event with stored signature to detect changes.
+    Hash a signature dictionary into a short, stable hex digest.
+    """
+    return hashlib.blake2b(orjson.dumps(signature, option=orjson.OPT_SORT_KEYS), digest_size=16).hexdigest()
+
+def events_are_different(current_signature, stored_signature):
+    """
+    Compare the current event signature with the stored one to detect changes.
     Returns True if the events are different and need updating.
     """
     if not stored_signature:
         return True  # No previous data, consider it different
     
-    current_signature = get_event_signature(current_event)
-    
-    # Compare all key fields
-    for key in current_signature:
-        if current_signature.get(key) != stored_signature.get(key):
-            return True
-    
-    return False
+    return current_signature != stored_signature
 
 def get_google_calendar_service():
     """
     Set up the Google Calendar API service using the provided credentials.
+    The service is built once and reused until it is reset after an authentication failure.
     """
-    credentials, _ = google.auth.load_credentials_from_file(var.GOOGLE_CREDENTIALS_JSON)
-    service = build('calendar', 'v3', credentials=credentials)
-    return service
+    global _calendar_service
+    if _calendar_service is None:
+        credentials, _ = google.auth.load_credentials_from_file(var.GOOGLE_CREDENTIALS_JSON)
+        _calendar_service = build('calendar', 'v3', credentials=credentials, cache_discovery=False)
+    return _calendar_service
 
-def get_upcoming_events(service):
+async def get_upcoming_events(service):
     """
     Fetch upcoming events from Google Calendar within the specified time frame.
     Handles pagination to retrieve all events.
@@ -289,6 +371,7 @@ def get_upcoming_events(service):
     time_min = now.strftime('%Y-%m-%dT%H:%M:%S') + 'Z'
     time_max = (now + datetime.timedelta(days=var.DAYS_IN_FUTURE)).strftime('%Y-%m-%dT%H:%M:%S') + 'Z'
 
+    loop = asyncio.get_running_loop()
     all_events = []
     page_token = None
     page_count = 0
@@ -305,15 +388,17 @@ def get_upcoming_events(service):
             'q': var.GOOGLE_FREETEXT_QUERY_STRING,
             'maxResults': 250,  # Increased from 100 for better efficiency
             'singleEvents': True,
-            'orderBy': 'startTime'
+            'orderBy': 'startTime',
+            # Only request the event fields used for filtering and syncing
+            'fields': 'nextPageToken,items(id,summary,description,location,start,end,creator/email,attendees/email)'
         }
         
         # Add page token if we're fetching a subsequent page
         if page_token:
             request_params['pageToken'] = page_token
         
-        # Make the API request
-        events_result = service.events().list(**request_params).execute()
+        # Make the API request in a worker thread, googleapiclient is blocking
+        events_result = await loop.run_in_executor(None, service.events().list(**request_params).execute)
         
         # Get events from this page
         page_events = events_result.get('items', [])
@@ -329,47 +414,125 @@ def get_upcoming_events(service):
     log_event(f"Total events retrieved: {len(all_events)} across {page_count} page(s).")
     return all_events
 
-def get_discord_events():
+class DiscordBucket:
+    """
+    Track Discord's rate limit headers so requests only wait when the bucket is exhausted.
+    Requests still in flight count against the remaining budget. Until the first
+    rate limit headers arrive, only one request is allowed through at a time.
+    """
+    def __init__(self):
+        self.limit = 1
+        self.remaining = 1
+        self.reset_at = 0.0
+        self.in_flight = 0
+        # Set from a 429's retry_after, route headers from other responses never shorten it
+        self.blocked_until = 0.0
+        self.condition = asyncio.Condition()
+
+    async def acquire(self):
+        """
+        Wait until the bucket has a request available and take it.
+        """
+        async with self.condition:
+            while True:
+                now = time.monotonic()
+                if now < self.blocked_until:
+                    # Rate limited by Discord, nothing goes out until retry_after has passed
+                    try:
+                        await asyncio.wait_for(self.condition.wait(), self.blocked_until - now)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                if self.reset_at and now >= self.reset_at:
+                    # The rate limit window has passed, refill the bucket
+                    self.remaining = self.limit
+                    self.reset_at = 0.0
+                if self.remaining - self.in_flight > 0:
+                    self.in_flight += 1
+                    return
+                # Wait for the window to reset, or for an in-flight response to update the bucket
+                timeout = self.reset_at - now if self.reset_at else None
+                try:
+                    await asyncio.wait_for(self.condition.wait(), timeout)
+                except asyncio.TimeoutError:
+                    pass
+
+    async def release(self, response=None):
+        """
+        Finish a request taken with acquire, updating the bucket from the response's rate limit headers.
+        """
+        async with self.condition:
+            self.in_flight -= 1
+            if response is not None:
+                self.update(response)
+            self.condition.notify_all()
+
+    async def block_for(self, seconds):
+        """
+        Hold back every request for the given number of seconds, e.g. the retry_after of a 429.
+        """
+        async with self.condition:
+            self.blocked_until = max(self.blocked_until, time.monotonic() + seconds)
+
+    def update(self, response):
+        """
+        Refresh the bucket from the rate limit headers of a Discord response.
+        """
+        remaining = response.headers.get('X-RateLimit-Remaining')
+        reset_after = response.headers.get('X-RateLimit-Reset-After')
+        if remaining is not None and reset_after is not None:
+            self.limit = int(response.headers.get('X-RateLimit-Limit', self.limit))
+            self.remaining = int(remaining)
+            self.reset_at = time.monotonic() + float(reset_after)
+
+async def send_discord_request(method, url, data=None):
+    """
+    Send a request to the Discord API using the bot's shared HTTP session.
+    The response body is read before returning so it can be used after the connection is released.
+    """
+    if data is not None:
+        body = orjson.dumps(data)
+        headers = {"Content-Type": "application/json"}
+    else:
+        body = None
+        headers = None
+    await bot.discord_bucket.acquire()
+    response = None
+    try:
+        async with bot.discord_session.request(method, url, data=body, headers=headers) as response:
+            await response.read()
+    finally:
+        await bot.discord_bucket.release(response)
+    return response
+
+async def get_discord_events():
     """
     Fetch existing scheduled events from the Discord server.
     """
     log_event("Requesting events from Discord.")
     url = f"https://discord.com/api/v9/guilds/{var.DISCORD_GUILD_ID}/scheduled-events"
-    headers = {
-        "Authorization": f"Bot {var.DISCORD_BOT_TOKEN}"
-    }
-    response = requests.get(url, headers=headers)
-    if response.status_code == 200:
-        return response.json()
+    response = await send_discord_request('GET', url)
+    if response.status == 200:
+        return orjson.loads(await response.read())
     else:
-        log_event(f"Failed to fetch Discord events: {response.content}")
+        log_event(f"Failed to fetch Discord events: {await response.text()}")
         return []
 
-def create_or_update_discord_event(event, discord_event_id=None):
+async def create_or_update_discord_event(event, event_times, discord_event_id=None):
     """
     Create a new scheduled event on Discord or update an existing one.
+    event_times is the (start, end) pair returned by normalized_times.
     """
     if discord_event_id is None:
         # Creating a new event
         url = f"https://discord.com/api/v9/guilds/{var.DISCORD_GUILD_ID}/scheduled-events"
-        method = requests.post
+        method = 'POST'
     else:
         # Updating an existing event
         url = f"https://discord.com/api/v9/guilds/{var.DISCORD_GUILD_ID}/scheduled-events/{discord_event_id}"
-        method = requests.patch
+        method = 'PATCH'
 
-    headers = {
-        "Authorization": f"Bot {var.DISCORD_BOT_TOKEN}",
-        "Content-Type": "application/json"
-    }
-
-    # Get start and end times, handling all-day events
-    start_time = event['start'].get('dateTime', event['start'].get('date')) # All-day events have 'date' instead of 'dateTime'
-    end_time = event['end'].get('dateTime', event['end'].get('date')) # All-day events have 'date' instead of 'dateTime'
-
-    if 'date' in event['start']:
-        end_time = convert_utc_to_timezone(start_time + 'T23:59:59', var.TIMEZONE) # All-day event ends at 23:59:59
-        start_time = convert_utc_to_timezone(start_time + 'T00:00:00', var.TIMEZONE) # All-day event starts at 00:00:00
+    start_time, end_time = event_times
 
     # Determine event type based on location
     event_location = event.get('location', '').lower()
@@ -394,96 +557,122 @@ def create_or_update_discord_event(event, discord_event_id=None):
             "location": event.get('location', 'External Event')
         }
 
-    response = method(url, json=data, headers=headers)
+    response = await send_discord_request(method, url, data)
     
     # Handle rate limiting with retry logic
     max_retries = 3
     retry_count = 0
     
-    while response.status_code == 429 and retry_count < max_retries:
+    while response.status == 429 and retry_count < max_retries:
         try:
             # Parse the rate limit response
-            rate_limit_data = response.json()
+            rate_limit_data = orjson.loads(await response.read())
             retry_after = rate_limit_data.get('retry_after', 5.0)
             
             log_event(f"Rate limited, waiting {retry_after} seconds before retry (attempt {retry_count + 1}/{max_retries})")
-            time.sleep(retry_after + 0.5)  # Add small buffer
+            await bot.discord_bucket.block_for(retry_after + 0.5)  # Add small buffer
             
             # Retry the request
-            response = method(url, json=data, headers=headers)
+            response = await send_discord_request(method, url, data)
             retry_count += 1
             
-        except (json.JSONDecodeError, KeyError):
+        except (orjson.JSONDecodeError, KeyError):
             # Fallback if we can't parse the response
             log_event(f"Rate limited, waiting 5 seconds before retry (attempt {retry_count + 1}/{max_retries})")
-            time.sleep(5.0)
-            response = method(url, json=data, headers=headers)
+            await bot.discord_bucket.block_for(5.0)
+            response = await send_discord_request(method, url, data)
             retry_count += 1
     
-    # Always sleep between requests to prevent rapid-fire API calls
-    time.sleep(2)
-    
-    if response.status_code in (200, 201):
+    if response.status in (200, 201):
         action = 'updated' if discord_event_id else 'created'
         log_event(f"Event {event['summary']} {action} on Discord")
-        return response.json().get('id')
-    elif response.status_code == 429:
+        return orjson.loads(await response.read()).get('id')
+    elif response.status == 429:
         action = 'update' if discord_event_id else 'create'
         log_event(f"Failed to {action} event {event['summary']} on Discord after {max_retries} retries: Rate limited")
         return None
     else:
         action = 'update' if discord_event_id else 'create'
-        log_event(f"Failed to {action} event {event['summary']} on Discord: {response.content}")
+        log_event(f"Failed to {action} event {event['summary']} on Discord: {await response.text()}")
         return None
 
-def delete_discord_event(event_id):
+async def delete_discord_event(event_id):
     """
     Delete a scheduled event from Discord using its event ID.
     """
     url = f"https://discord.com/api/v9/guilds/{var.DISCORD_GUILD_ID}/scheduled-events/{event_id}"
-    headers = {
-        "Authorization": f"Bot {var.DISCORD_BOT_TOKEN}"
-    }
-    response = requests.delete(url, headers=headers)
+    response = await send_discord_request('DELETE', url)
     
     # Handle rate limiting with retry logic
     max_retries = 3
     retry_count = 0
     
-    while response.status_code == 429 and retry_count < max_retries:
+    while response.status == 429 and retry_count < max_retries:
         try:
             # Parse the rate limit response
-            rate_limit_data = response.json()
+            rate_limit_data = orjson.loads(await response.read())
             retry_after = rate_limit_data.get('retry_after', 5.0)
             
             log_event(f"Rate limited on delete, waiting {retry_after} seconds before retry (attempt {retry_count + 1}/{max_retries})")
-            time.sleep(retry_after + 0.5)  # Add small buffer
+            await bot.discord_bucket.block_for(retry_after + 0.5)  # Add small buffer
             
             # Retry the request
-            response = requests.delete(url, headers=headers)
+            response = await send_discord_request('DELETE', url)
             retry_count += 1
             
-        except (json.JSONDecodeError, KeyError):
+        except (orjson.JSONDecodeError, KeyError):
             # Fallback if we can't parse the response
             log_event(f"Rate limited on delete, waiting 5 seconds before retry (attempt {retry_count + 1}/{max_retries})")
-            time.sleep(5.0)
-            response = requests.delete(url, headers=headers)
+            await bot.discord_bucket.block_for(5.0)
+            response = await send_discord_request('DELETE', url)
             retry_count += 1
     
-    # Always sleep between requests
-    time.sleep(2)
-    
-    if response.status_code == 204:
+    if response.status == 204:
         log_event(f"Event {event_id} deleted from Discord")
-    elif response.status_code == 429:
+    elif response.status == 429:
         log_event(f"Failed to delete event {event_id} from Discord after {max_retries} retries: Rate limited")
     else:
-        log_event(f"Failed to delete event {event_id} from Discord: {response.content}")
+        log_event(f"Failed to delete event {event_id} from Discord: {await response.text()}")
+
+async def gather_or_raise(coroutines):
+    """
+    Run coroutines concurrently and wait for all of them to finish.
+    Re-raises the first exception afterwards so no task is left running in the background.
+    """
+    results = await asyncio.gather(*coroutines, return_exceptions=True)
+    for result in results:
+        if isinstance(result, Exception):
+            raise result
+
+class SyncBot(commands.Bot):
+    """
+    Discord bot that owns the HTTP session and rate limit bucket used for the Discord API.
+    """
+    discord_session = None
+    discord_bucket = None
+
+    async def setup_hook(self):
+        """
+        One-time async setup, runs before the bot connects to Discord.
+        """
+        self.discord_session = aiohttp.ClientSession(headers={"Authorization": f"Bot {var.DISCORD_BOT_TOKEN}"})
+        self.discord_bucket = DiscordBucket()
+        sync_events_loop.start()
+
+    async def close(self):
+        """
+        Stop syncing and close the HTTP session before shutting down.
+        """
+        sync_events_loop.cancel()
+        # setup_hook never runs if logging in fails
+        if self.discord_session is not None:
+            await self.discord_session.close()
+        await super().close()
 
 # Set up the Discord bot with the necessary intents
 intents = Intents.default()
 intents.message_content = True
-bot = commands.Bot(command_prefix='!', intents=intents)
+bot = SyncBot(command_prefix='!', intents=intents)
 
 synced_events = load_synced_events()
 
@@ -493,89 +682,113 @@ async def on_ready():
     Event handler for when the bot is ready and connected to Discord.
     """
     log_event("Bot logged in and ready.")
-    sync_events_loop.start()
 
 @tasks.loop(seconds=var.SYNC_INTERVAL)
 async def sync_events_loop():
     """
     Periodically synchronize events from Google Calendar to Discord.
     """
+    global synced_events, _calendar_service
+    # Changes are collected in memory and written to disk once per sync
+    synced_events_changed = False
     try:
-        service = get_google_calendar_service()
-        events = get_upcoming_events(service)
-        discord_events = get_discord_events()
-        global synced_events
+        loop = asyncio.get_running_loop()
+        service = await loop.run_in_executor(None, get_google_calendar_service)
+        events = await get_upcoming_events(service)
+        # Only the IDs of existing Discord events are needed, drop the full event payloads right away
+        discord_event_ids = frozenset(event['id'] for event in await get_discord_events())
 
         # Filter events based on configured criteria
         filtered_events = [event for event in events if should_sync_event(event)]
         log_event(f"Filtered {len(events)} Google Calendar events down to {len(filtered_events)} events for sync.")
-        
-        # Create a set of current Discord event IDs for quick lookup
-        discord_event_ids = {event['id'] for event in discord_events}
-
-        for event in filtered_events:
-            #time.sleep(3)  # Increased delay to prevent rate limiting
-            event_id = event['id']
-            current_signature = get_event_signature(event)
-            event_data = {
-                "date": event['start'].get('dateTime', event['start'].get('date')),
-                "title": event['summary'],
-                "channel": var.DISCORD_CHANNEL_ID,
-                "notes": event.get('description', ''),
-                "signature": current_signature  # Store signature for change detection
-            }
 
-            # Check if the event has already been synchronized
-            if any(e["google_event_id"] == event_id for e in synced_events["events"]):
-                for synced_event in synced_events["events"]:
-                    if synced_event["google_event_id"] == event_id:
-                        discord_event_id = synced_event["discord_event_id"]
-                        stored_signature = synced_event.get("signature", {})
-                        
-                        if discord_event_id not in discord_event_ids:
-                            # The event is missing on Discord, recreate it
-                            log_event(f"Event {event['summary']} is missing on Discord, recreating")
-                            discord_event_id = create_or_update_discord_event(event)
-                            if discord_event_id:
-                                synced_event["discord_event_id"] = discord_event_id
-                                synced_event.update(event_data)
-                                save_synced_events(synced_events)
-                            time.sleep(3)  # Increased delay to prevent rate limiting
-                        elif events_are_different(event, stored_signature):
-                            # Event has changed, update it on Discord
-                            log_event(f"Event {event['summary']} has changed, updating on Discord")
-                            discord_event_id = create_or_update_discord_event(event, discord_event_id)
-                            if discord_event_id:
-                                synced_event.update(event_data)
-                                save_synced_events(synced_events)
-                            time.sleep(3)  # Increased delay to prevent rate limiting
-                        else:
-                            # Event hasn't changed, skip update
-                            log_event(f"Event {event['summary']} unchanged, skipping update")
-                        break
-            else:
-                # The event is new, create it on Discord
-                discord_event_id = create_or_update_discord_event(event)
-                if discord_event_id:
-                    synced_events["events"].append({
-                        "google_event_id": event_id,
-                        "discord_event_id": discord_event_id,
-                        **event_data
-                    })
-                    save_synced_events(synced_events)
+        # Events are synced concurrently, bounded so only a few Discord requests are in flight
+        discord_semaphore = asyncio.Semaphore(DISCORD_SYNC_CONCURRENCY)
+
+        async def sync_event(event):
+            """
+            Create, update or recreate a single Google Calendar event on Discord.
+            """
+            nonlocal synced_events_changed
+            async with discord_semaphore:
+                event_id = event['id']
+                event_times = normalized_times(event)
+                current_signature = get_event_signature(event, event_times)
+                event_data = {
+                    "date": event['start'].get('dateTime', event['start'].get('date')),
+                    "title": event['summary'],
+                    "channel": var.DISCORD_CHANNEL_ID,
+                    "notes": event.get('description', ''),
+                    "sig_hash": current_signature  # Store signature hash for change detection
+                }
+
+                # Check if the event has already been synchronized
+                synced_event = synced_events.get(event_id)
+                if synced_event is not None:
+                    discord_event_id = synced_event["discord_event_id"]
+                    stored_signature = synced_event.get("sig_hash")
+                
+                    if discord_event_id not in discord_event_ids:
+                        # The event is missing on Discord, recreate it
+                        log_event(f"Event {event['summary']} is missing on Discord, recreating")
+                        discord_event_id = await create_or_update_discord_event(event, event_times)
+                        if discord_event_id:
+                            synced_event["discord_event_id"] = discord_event_id
+                            synced_event.update(event_data)
+                            synced_events_changed = True
+                    elif events_are_different(current_signature, stored_signature):
+                        # Event has changed, update it on Discord
+                        log_event(f"Event {event['summary']} has changed, updating on Discord")
+                        discord_event_id = await create_or_update_discord_event(event, event_times, discord_event_id)
+                        if discord_event_id:
+                            synced_event.update(event_data)
+                            synced_events_changed = True
+                    else:
+                        # Event hasn't changed, skip update
+                        log_event(f"Event {event['summary']} unchanged, skipping update")
+                else:
+                    # The event is new, create it on Discord
+                    discord_event_id = await create_or_update_discord_event(event, event_times)
+                    if discord_event_id:
+                        synced_events[event_id] = {
+                            "discord_event_id": discord_event_id,
+                            **event_data
+                        }
+                        synced_events_changed = True
+
+        await gather_or_raise(sync_event(event) for event in filtered_events)
 
         # Remove events from Discord that no longer exist in filtered Google Calendar events
         google_event_ids = {event['id'] for event in filtered_events}
-        for synced_event in list(synced_events["events"]):
-            #time.sleep(3)  # Increased delay to prevent rate limiting
-            if synced_event["google_event_id"] not in google_event_ids:
-                delete_discord_event(synced_event["discord_event_id"])
-                synced_events["events"].remove(synced_event)
-                save_synced_events(synced_events)
-                time.sleep(3)  # Increased delay to prevent rate limiting
-
+        stale_event_ids = [gid for gid in synced_events if gid not in google_event_ids]
+
+        async def delete_stale_event(google_event_id):
+            """
+            Delete a synchronized event from Discord and forget about it.
+            """
+            nonlocal synced_events_changed
+            async with discord_semaphore:
+                await delete_discord_event(synced_events[google_event_id]["discord_event_id"])
+                del synced_events[google_event_id]
+                synced_events_changed = True
+
+        await gather_or_raise(delete_stale_event(gid) for gid in stale_event_ids)
+
+    except HttpError as e:
+        if e.resp.status == 401:
+            # Force credentials and service to be rebuilt on the next sync
+            _calendar_service = None
+        log_event(f"Error in sync_events_loop: {e}")
+    except RefreshError as e:
+        # Credentials could not be refreshed (e.g. the key was revoked or replaced), reload them next sync
+        _calendar_service = None
+        log_event(f"Error in sync_events_loop: {e}")
     except Exception as e:
         log_event(f"Error in sync_events_loop: {e}")
+    finally:
+        # Persist whatever was synchronized, even if the sync was interrupted
+        if synced_events_changed:
+            save_synced_events(synced_events)
 
 # Run the bot using the token from var.py
 bot.run(var.DISCORD_BOT_TOKEN)